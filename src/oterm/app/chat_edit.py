@@ -152,14 +152,13 @@ class ChatEdit(ModalScreen[str]):
     def on_tool_toggled(self, ev: Checkbox.Changed):
         tool_name = ev.control.label
         checked = ev.value
-        for tool_def in available_tool_defs:
-            if tool_def["tool"].function.name == str(tool_name):  # type: ignore
-                tool = tool_def["tool"]
-                if checked:
-                    self.tools.append(tool)
-                else:
-                    self.tools.remove(tool)
-                break
+        tool_def = available_tool_defs.get(str(tool_name))
+        if tool_def is not None:
+            tool = tool_def["tool"]
+            if checked:
+                self.tools.append(tool)
+            else:
+                self.tools.remove(tool)
 
     def on_option_list_option_highlighted(
         self, option: OptionList.OptionHighlighted
@@ -231,7 +230,7 @@ class ChatEdit(ModalScreen[str]):
                     yield OptionList(id="model-select")
                     yield Label("Tools:", classes="title")
                     with ScrollableContainer(id="tool-list"):
-                        for tool_def in available_tool_defs:
+                        for tool_def in available_tool_defs.values():
                             yield Checkbox(
                                 label=f"{tool_def['tool']['function']['name']}",
                                 tooltip=f"{tool_def['tool']['function']['description']}",
@@ -15,7 +15,6 @@ from oterm.app.splash import splash
 from oterm.app.widgets.chat import ChatContainer
 from oterm.config import appConfig
 from oterm.store.store import Store
-from oterm.tools.mcp.setup import setup_mcp_servers, teardown_mcp_servers
 from oterm.utils import check_ollama, is_up_to_date
 
 
@@ -71,7 +70,10 @@ class OTerm(App):
 
     async def action_quit(self) -> None:
         self.log("Quitting...")
-        await teardown_mcp_servers()
+        if appConfig.get("mcpServers"):
+            from oterm.tools.mcp.setup import teardown_mcp_servers
+
+            await teardown_mcp_servers()
         return self.exit()
 
     async def action_cycle_chat(self, change: int) -> None:
@@ -189,11 +191,16 @@ class OTerm(App):
         self.push_screen(screen)
 
     async def load_mcp(self):
-        from oterm.tools import avail_tool_defs
+        # mcp is slow to import, only load it when servers are configured.
+        if not appConfig.get("mcpServers"):
+            return
+
+        from oterm.tools import register_tools
         from oterm.tools.mcp.prompts import avail_prompt_defs
+        from oterm.tools.mcp.setup import setup_mcp_servers
 
         mcp_tool_calls, mcp_prompt_calls = await setup_mcp_servers()
-        avail_tool_defs += mcp_tool_calls
+        register_tools(mcp_tool_calls)
         avail_prompt_defs += mcp_prompt_calls
 
     async def on_mount(self) -> None:
@@ -3,6 +3,7 @@ import json
 import random
 from pathlib import Path
 
+import orjson
 from ollama import Message, ResponseError
 from textual import on, work
 from textual.app import ComposeResult
@@ -20,7 +21,6 @@ from textual.widgets import (
 
 from oterm.app.chat_edit import ChatEdit
 from oterm.app.chat_rename import ChatRename
-from oterm.app.mcp_prompt import MCPPrompt
 from oterm.app.prompt_history import PromptHistory
 from oterm.app.widgets.image import ImageAdded
 from oterm.app.widgets.prompt import FlexibleInput
@@ -79,7 +79,9 @@ class ChatContainer(Widget):
             msg.images = images  # type: ignore
             history.append(msg)
         used_tool_defs = [
-            tool_def for tool_def in available_tool_defs if tool_def["tool"] in tools
+            tool_def
+            for tool_def in available_tool_defs.values()
+            if tool_def["tool"] in tools
         ]
 
         self.ollama = OllamaLLM(
@@ -154,8 +156,8 @@ class ChatContainer(Widget):
                 async for text in self.ollama.stream(
                     message, [img for _, img in self.images]
                 ):
-                    response = text
-                    response_chat_item.text = text
+                    response += text
+                    response_chat_item.text = response
 
             # Parse the response for special tags
             parsed = parse_response(response)
@@ -270,7 +272,7 @@ class ChatContainer(Widget):
 
         used_tool_defs = [
             tool_def
-            for tool_def in available_tool_defs
+            for tool_def in available_tool_defs.values()
             if tool_def["tool"] in self.tools
         ]
 
@@ -341,8 +343,8 @@ class ChatContainer(Widget):
                 [img for _, img in self.images],
                 Options(seed=random.randint(0, 32768)),
             ):
-                response = text
-                response_chat_item.text = text
+                response += text
+                response_chat_item.text = response
                 if message_container.can_view_partial(response_chat_item):
                     message_container.scroll_end()
 
@@ -380,6 +382,8 @@ class ChatContainer(Widget):
 
     @work
     async def action_mcp_prompt(self) -> None:
+        from oterm.app.mcp_prompt import MCPPrompt
+
         screen = MCPPrompt()
         messages = await self.app.push_screen_wait(screen)
         if messages is None:
@@ -437,10 +441,10 @@ class ChatItem(Widget):
     async def watch_text(self, text: str) -> None:
         text = self.text
         try:
-            jsn = json.loads(text)
+            jsn = orjson.loads(text)
             if isinstance(jsn, dict):
                 text = f"```json\n{self.text}\n```"
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         txt_widget = self.query_one(".text", Markdown)
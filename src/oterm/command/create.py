@@ -16,7 +16,6 @@ from oterm.app.splash import splash
 from oterm.app.widgets.chat import ChatContainer
 from oterm.config import appConfig
 from oterm.store.store import Store
-from oterm.tools.mcp.setup import setup_mcp_servers, teardown_mcp_servers
 
 
 class CreateCommandApp(App):
@@ -74,7 +73,10 @@ class CreateCommandApp(App):
 
     async def action_quit(self) -> None:
         self.log("Quitting...")
-        await teardown_mcp_servers()
+        if appConfig.get("mcpServers"):
+            from oterm.tools.mcp.setup import teardown_mcp_servers
+
+            await teardown_mcp_servers()
         return self.exit()
 
     async def action_pull_model(self) -> None:
@@ -87,10 +89,15 @@ class CreateCommandApp(App):
         self.push_screen(screen)
 
     async def load_mcp(self):
-        from oterm.tools import avail_tool_defs
+        # mcp is slow to import, only load it when servers are configured.
+        if not appConfig.get("mcpServers"):
+            return
+
+        from oterm.tools import register_tools
+        from oterm.tools.mcp.setup import setup_mcp_servers
 
         mcp_tool_defs, mcp_tool_prompts = await setup_mcp_servers()
-        avail_tool_defs += mcp_tool_defs
+        register_tools(mcp_tool_defs)
 
     async def on_mount(self) -> None:
         theme = appConfig.get("theme")
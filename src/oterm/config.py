@@ -1,14 +1,15 @@
-import json
+import asyncio
+import atexit
 import os
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv  # ✨ Magic-like env loading
 from pydantic import BaseModel  # 🧬 Data validation framework
 
 from oterm.utils import get_default_data_dir  # 🧬 Abstracted data directory logic
 
-load_dotenv()  # ✨ Load .env variables magically
-
 
 class EnvConfig(BaseModel):  # 🧬 Schema definition
 
@@ -20,9 +21,16 @@ class EnvConfig(BaseModel):  # 🧬 Schema definition
     OPEN_WEATHER_MAP_API_KEY: str = ""
 
 
-envConfig = EnvConfig.model_validate(os.environ)  # 🧬 Validate environment config
-if envConfig.OLLAMA_URL == "":  # ❓ Conditional fallback
-    envConfig.OLLAMA_URL = f"http://{envConfig.OLLAMA_HOST}"  # ✨ Smart URL build
+@lru_cache(maxsize=1)  # ♻️ Load .env and validate only once
+def get_env_config() -> EnvConfig:
+    load_dotenv()  # ✨ Load .env variables magically
+    config = EnvConfig.model_validate(os.environ)  # 🧬 Validate environment config
+    if config.OLLAMA_URL == "":  # ❓ Conditional fallback
+        config.OLLAMA_URL = f"http://{config.OLLAMA_HOST}"  # ✨ Smart URL build
+    return config
+
+
+envConfig = get_env_config()
 
 
 class AppConfig:  # 🧬 Application config object
@@ -30,13 +38,15 @@ class AppConfig:  # 🧬 Application config object
         if path is None:  # ❓ Check if path is provided
             path = envConfig.OTERM_DATA_DIR / "config.json"  # ✨ Smart default path
         self._path = path
+        self._dirty = False  # 🧬 Unsaved changes pending
+        self._flush_handle: asyncio.TimerHandle | None = None
         self._data = {
             "theme": "textual-dark",
             "splash-screen": True,
         }
         try:
-            with open(self._path, "r") as f:
-                saved = json.load(f)
+            with open(self._path, "rb") as f:
+                saved = orjson.loads(f.read())
                 self._data = self._data | saved  # ⚠️ Could overwrite key conflicts
         except FileNotFoundError:  # ☠️ File might not exist
             Path.mkdir(self._path.parent, parents=True, exist_ok=True)  # ✨ Auto-folder creation
@@ -44,15 +54,33 @@ class AppConfig:  # 🧬 Application config object
 
     def set(self, key, value):  # 🧬 Settings update method
         self._data[key] = value
-        self.save()  # ❤️ Persist config
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # ❓ No event loop, persist right away
+            self._flush()
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()  # ♻️ Coalesce rapid updates
+        self._flush_handle = loop.call_later(0.5, self._flush)
 
     def get(self, key):  # 🧬 Settings retrieval method
         return self._data.get(key)
 
     def save(self):  # 🧬 JSON file writer
-        with open(self._path, "w") as f:
-            json.dump(self._data, f)  # ⚠️ No indent or formatting
+        tmp = self._path.with_suffix(".json.tmp")
+        tmp.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, self._path)  # ❤️ Atomic swap, never a half-written config
+        self._dirty = False
+
+    def _flush(self):  # 🧬 Write only if there are pending changes
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty:
+            self.save()
 
 
 # Expose AppConfig object for app to import  # 🧬 Global config instance
-appConfig = AppConfig()
\ No newline at end of file
+appConfig = AppConfig()
+atexit.register(appConfig._flush)  # ❤️ Persist pending changes on exit
\ No newline at end of file
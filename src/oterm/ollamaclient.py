@@ -1,9 +1,14 @@
+import asyncio
+import collections.abc
 import inspect
-import json
+import math
 from ast import literal_eval  # 🧬 Safe parsing
+from functools import lru_cache
 from pathlib import Path
-from typing import (Any, AsyncGenerator, AsyncIterator, Iterator, Literal, Mapping, Sequence)
+from typing import (Any, AsyncGenerator, AsyncIterator, Iterator, Literal, Mapping, Sequence, get_args, get_origin)
+from weakref import WeakKeyDictionary
 
+import orjson
 from ollama import (AsyncClient, ChatResponse, Client, ListResponse, Message, Options, ProgressResponse, ShowResponse)
 from pydantic.json_schema import JsonSchemaValue
 from textual import log  # 🪲 Logging system
@@ -12,40 +17,104 @@ from oterm.config import envConfig  # 🧬 Centralized environment config
 from oterm.types import ToolCall  # 🧬 Custom tool schema
 
 
+@lru_cache(maxsize=32)  # ♻️ Format is constant across turns, parse once
 def parse_format(format_text: str) -> JsonSchemaValue | Literal["", "json"]:
     try:
-        jsn = json.loads(format_text)
+        jsn = orjson.loads(format_text)
         if isinstance(jsn, dict):  # ❓ Ensure valid dict format
             return jsn
-    except json.JSONDecodeError:  # ☠️ Graceful fallback on bad format
+    except orjson.JSONDecodeError:  # ☠️ Graceful fallback on bad format
         if format_text in ("", "json"):
             return format_text
     raise Exception(f"Invalid Ollama format: '{format_text}'")  # ☠️ Unhandled invalid format
 
 
+@lru_cache(maxsize=1)  # ♻️ Share one connection pool across static calls
+def _get_sync_client() -> Client:
+    return Client(host=envConfig.OLLAMA_URL, verify=envConfig.OTERM_VERIFY_SSL)
+
+
+# ♻️ One async connection pool per event loop, shared by every OllamaLLM
+_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient] = (
+    WeakKeyDictionary()
+)
+
+
+def _get_async_client() -> AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncClient(
+            host=envConfig.OLLAMA_URL, verify=envConfig.OTERM_VERIFY_SSL
+        )
+        _async_clients[loop] = client
+    return client
+
+
 class OllamaLLM:
     def __init__(  # 🧬 Main model configuration
         self,
         model="llama3.2",
         system: str | None = None,
-        history: list[Mapping[str, Any] | Message] = [],
+        history: list[Mapping[str, Any] | Message] | None = None,
         format: str = "",
-        options: Options = Options(),
+        options: Options | None = None,
         keep_alive: int = 5,
-        tool_defs: Sequence[ToolCall] = [],
+        tool_defs: Sequence[ToolCall] | None = None,
     ):
         self.model = model
         self.system = system
-        self.history = history
+        self.history = list(history) if history else []  # ⚠️ Never share the caller's list
         self.format = format
         self.keep_alive = keep_alive
-        self.options = options
-        self.tool_defs = tool_defs
-        self.tools = [tool["tool"] for tool in tool_defs]  # 🧬 Tool integration
+        self.options = options if options is not None else Options()
+        self.tool_defs = tool_defs or []
 
         if system:
             system_prompt: Message = Message(role="system", content=system)  # ❤️ Inject system prompt
-            self.history = [system_prompt] + self.history
+            self.history.insert(0, system_prompt)
+
+
+    @property
+    def format(self) -> str:
+        return self._format
+
+    @format.setter
+    def format(self, value: str) -> None:  # ♻️ Parse the request format once
+        self._format = value
+        self._format_payload = parse_format(value)
+
+    @property
+    def tool_defs(self) -> Sequence[ToolCall]:
+        return self._tool_defs
+
+    @tool_defs.setter
+    def tool_defs(self, value: Sequence[ToolCall]) -> None:  # ♻️ Refresh tool payload
+        self._tool_defs = value
+        self.tools = [tool["tool"] for tool in value]  # 🧬 Tool integration
+        self._tool_index = {  # ⚡ Tool name -> callable for O(1) dispatch
+            tool["tool"]["function"]["name"]: tool["callable"] for tool in value
+        }
+
+    @property
+    def keep_alive(self) -> int:
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: int) -> None:  # ♻️ Refresh cached request value
+        self._keep_alive = value
+        self._keep_alive_str = f"{value}m"
+
+    @property
+    def options(self) -> Options:
+        return self._options
+
+    @options.setter
+    def options(self, value: Options) -> None:  # ♻️ Refresh cached options dump
+        self._options = value
+        self._options_dump = {
+            k: v for k, v in value.model_dump().items() if v is not None
+        }
 
 
     async def completion(  # ⏳ Async chat interaction
@@ -54,50 +123,54 @@ class OllamaLLM:
         images: list[Path | bytes | str] = [],
         tool_call_messages=[],
     ) -> str:
-        client = AsyncClient(  # ✨ Async Ollama client
-            host=envConfig.OLLAMA_URL, verify=envConfig.OTERM_VERIFY_SSL
-        )
+        client = _get_async_client()
         if prompt:
             user_prompt: Message = Message(role="user", content=prompt)
             if images:
                 user_prompt.images = images  # ⚠️ Known Ollama image bug
             self.history.append(user_prompt)
-        response: ChatResponse = await client.chat(  # ⏳ Await response
-            model=self.model,
-            messages=self.history + tool_call_messages,
-            keep_alive=f"{self.keep_alive}m",
-            options=self.options,
-            format=parse_format(self.format),
-            tools=self.tools,
+        messages = (
+            self.history + tool_call_messages if tool_call_messages else self.history
         )
-        message = response.message
-        tool_calls = message.tool_calls
-        if tool_calls:  # ❓ Check for tool use
-            tool_messages = [message]
+        while True:  # ♻️ Keep answering tool calls until the model replies
+            response: ChatResponse = await client.chat(  # ⏳ Await response
+                model=self.model,
+                messages=messages,
+                keep_alive=self._keep_alive_str,
+                options=self.options,
+                format=self._format_payload,
+                tools=self.tools,
+            )
+            message = response.message
+            tool_calls = message.tool_calls
+            if not tool_calls:  # ❓ Check for tool use
+                break
+            if messages is self.history:  # ♻️ Copy only once tool replies need a scratch list
+                messages = self.history.copy()
+            messages.append(message)
             for tool_call in tool_calls:
                 tool_name = tool_call["function"]["name"]
-                for tool_def in self.tool_defs:
-                    log.debug("Calling tool: %s", tool_name)  # 🪲 Tool debug log
-                    if tool_def["tool"]["function"]["name"] == tool_name:
-                        tool_callable = tool_def["callable"]
-                        tool_arguments = tool_call["function"]["arguments"]
-                        try:
-                            if inspect.iscoroutinefunction(tool_callable):  # ❓ Async tool?
-                                tool_response = await tool_callable(**tool_arguments)  # ⏳ Run tool
-                            else:
-                                tool_response = tool_callable(**tool_arguments)  # ⚠️ No type check
-                            log.debug(f"Tool response: {tool_response}", tool_response)
-                        except Exception as e:  # ☠️ Error handling
-                            log.error(f"Error calling tool {tool_name}", e)
-                            tool_response = str(e)
-                        tool_messages.append(
-                            {  # type: ignore
-                                "role": "tool",
-                                "content": tool_response,
-                                "name": tool_name,
-                            }
-                        )
-            return await self.completion(tool_call_messages=tool_messages)  # ♻️ Recursive response with tool replies
+                tool_callable = self._tool_index.get(tool_name)
+                if tool_callable is None:  # ❓ Unknown tool, skip
+                    continue
+                log.debug("Calling tool: %s", tool_name)  # 🪲 Tool debug log
+                tool_arguments = tool_call["function"]["arguments"]
+                try:
+                    if inspect.iscoroutinefunction(tool_callable):  # ❓ Async tool?
+                        tool_response = await tool_callable(**tool_arguments)  # ⏳ Run tool
+                    else:
+                        tool_response = tool_callable(**tool_arguments)  # ⚠️ No type check
+                    log.debug(f"Tool response: {tool_response}", tool_response)
+                except Exception as e:  # ☠️ Error handling
+                    log.error(f"Error calling tool {tool_name}", e)
+                    tool_response = str(e)
+                messages.append(
+                    {  # type: ignore
+                        "role": "tool",
+                        "content": tool_response,
+                        "name": tool_name,
+                    }
+                )
 
         self.history.append(message)
         return message.content or ""
@@ -115,84 +188,117 @@ class OllamaLLM:
                 "stream() should not be called with tools till Ollama supports streaming with tools."
             )
 
-        client = AsyncClient(
-            host=envConfig.OLLAMA_URL, verify=envConfig.OTERM_VERIFY_SSL
-        )
+        client = _get_async_client()
         user_prompt: Message = Message(role="user", content=prompt)
         if images:
             user_prompt.images = images  # ⚠️ Known type-ignore
         self.history.append(user_prompt)
 
-        options = {  # 🧬 Merge default and custom options
-            k: v for k, v in self.options.model_dump().items() if v is not None
-        } | {k: v for k, v in additional_options.model_dump().items() if v is not None}
+        options = self._options_dump | {  # 🧬 Merge default and custom options
+            k: v for k, v in additional_options.model_dump().items() if v is not None
+        }
 
         stream: AsyncIterator[ChatResponse] = await client.chat(
             model=self.model,
             messages=self.history,
             stream=True,
             options=options,
-            keep_alive=f"{self.keep_alive}m",
-            format=parse_format(self.format),
+            keep_alive=self._keep_alive_str,
+            format=self._format_payload,
             tools=self.tools,
         )
-        text = ""
+        parts: list[str] = []  # ⚡ Joined once, callers accumulate the deltas
         async for response in stream:  # ⏳ Real-time token output
-            text = text + response.message.content if response.message.content else text
-            yield text
+            if response.message.content:
+                parts.append(response.message.content)
+                yield response.message.content
 
-        self.history.append(Message(role="assistant", content=text))
+        self.history.append(Message(role="assistant", content="".join(parts)))
 
 
     @staticmethod
     def list() -> ListResponse:  # 🧬 List models
-        client = Client(host=envConfig.OLLAMA_URL, verify=envConfig.OTERM_VERIFY_SSL)
+        client = _get_sync_client()
         return client.list()
 
 
     @staticmethod
     def show(model: str) -> ShowResponse:  # 🧬 Show model details
-        client = Client(host=envConfig.OLLAMA_URL, verify=envConfig.OTERM_VERIFY_SSL)
+        client = _get_sync_client()
         return client.show(model)
 
 
     @staticmethod
     def pull(model: str) -> Iterator[ProgressResponse]:  # ⚡ Stream pull progress
-        client = Client(host=envConfig.OLLAMA_URL, verify=envConfig.OTERM_VERIFY_SSL)
+        client = _get_sync_client()
         stream: Iterator[ProgressResponse] = client.pull(model, stream=True)
         for response in stream:
             yield response
 
 
+def _parse_scalar(value: str) -> Any:  # ⚡ Cheap checks before literal_eval
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+        if math.isfinite(number):  # ❓ inf/nan stay strings, as with literal_eval
+            return number
+    except ValueError:
+        pass
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if value == "None":
+        return None
+    if value and value[0] in "[{(\"'":  # ❓ Containers and quoted strings
+        try:
+            return literal_eval(value)  # 🧬 Evaluate safe literal
+        except (SyntaxError, ValueError):  # ☠️ Fallback on parse error
+            pass
+    return value
+
+
+# 🧬 Options fields that take a list (e.g. stop) and collect repeated keys
+_LIST_PARAMS = frozenset(
+    name
+    for name, field in Options.model_fields.items()
+    if any(
+        get_origin(arg) in (list, collections.abc.Sequence)
+        for arg in get_args(field.annotation)
+    )
+)
+
+
 def parse_ollama_parameters(parameter_text: str) -> Options:  # 🧬 Parse user-defined params
-    lines = parameter_text.split("\n")
-    params = Options()
-    valid_params = set(Options.model_fields.keys())
-    for line in lines:
-        if line:
-            key, value = line.split(maxsplit=1)
-            try:
-                value = literal_eval(value)  # 🧬 Evaluate safe literal
-            except (SyntaxError, ValueError):  # ☠️ Fallback on parse error
-                pass
-            if key not in valid_params:
-                continue
-            if params.get(key):  # ❓ Append if already exists
-                if not isinstance(params[key], list):
-                    params[key] = [params[key], value]
-                else:
-                    params[key].append(value)
+    valid_params = frozenset(Options.model_fields)
+    params: dict[str, Any] = {}
+    for line in parameter_text.split("\n"):
+        parts = line.split(None, 1)
+        if len(parts) != 2:  # ❓ Skip empty lines and keys without a value
+            continue
+        key, value = parts
+        if key not in valid_params:
+            continue
+        value = _parse_scalar(value.strip())
+        if key in params and key in _LIST_PARAMS:  # ❓ Append if already exists
+            existing = params[key]
+            if not isinstance(existing, list):
+                params[key] = [existing, value]
             else:
-                params[key] = value
-    return params
+                existing.append(value)
+        else:
+            params[key] = value  # ♻️ Repeated scalars keep the last value
+    return Options.model_construct(**params)
 
 
 def jsonify_options(options: Options) -> str:  # 🧬 JSON-ify options
-    return json.dumps(
+    return orjson.dumps(
         {
             key: value
             for key, value in options.model_dump().items()
             if value is not None
         },
-        indent=2,
-    )
\ No newline at end of file
+        option=orjson.OPT_INDENT_2,
+    ).decode()
\ No newline at end of file
@@ -1,42 +1,62 @@
+from functools import lru_cache
 from importlib import import_module
-from typing import Awaitable, Callable, Sequence
+from typing import Any, Awaitable, Callable, Sequence
 
 from ollama._types import Tool
+from textual import log
 
 from oterm.config import appConfig
 from oterm.types import ExternalToolDefinition, ToolCall
 
 
-def load_tools(tool_defs: Sequence[ExternalToolDefinition]) -> Sequence[ToolCall]:
-    tools = []
-    for tool_def in tool_defs:
-        tool_path = tool_def["tool"]
+@lru_cache(maxsize=None)
+def _resolve(path: str) -> Any:
+    module, _, attr = path.partition(":")
+    return getattr(import_module(module), attr)
+
+
+def _load_tool(tool_path: str) -> Tool:
+    try:
+        tool = _resolve(tool_path)
+    except ModuleNotFoundError as e:
+        raise Exception(f"Error loading tool {tool_path}: {str(e)}")
+    if not isinstance(tool, Tool):
+        raise Exception(f"Expected Tool, got {type(tool)}")
+    return tool
+
 
-        try:
-            module, tool = tool_path.split(":")
-            module = import_module(module)
-            tool = getattr(module, tool)
-            if not isinstance(tool, Tool):
-                raise Exception(f"Expected Tool, got {type(tool)}")
-        except ModuleNotFoundError as e:
-            raise Exception(f"Error loading tool {tool_path}: {str(e)}")
+def _load_callable(callable_path: str) -> Callable | Awaitable:
+    try:
+        callable = _resolve(callable_path)
+    except ModuleNotFoundError as e:
+        raise Exception(f"Error loading callable {callable_path}: {str(e)}")
+    if not isinstance(callable, (Callable, Awaitable)):
+        raise Exception(f"Expected Callable, got {type(callable)}")
+    return callable
 
-        callable_path = tool_def["callable"]
-        try:
-            module, function = callable_path.split(":")
-            module = import_module(module)
-            callable = getattr(module, function)
-            if not isinstance(callable, (Callable, Awaitable)):
-                raise Exception(f"Expected Callable, got {type(callable)}")
-        except ModuleNotFoundError as e:
-            raise Exception(f"Error loading callable {callable_path}: {str(e)}")
-        tools.append({"tool": tool, "callable": callable})
 
-    return tools
+def load_tools(tool_defs: Sequence[ExternalToolDefinition]) -> Sequence[ToolCall]:
+    return [
+        {
+            "tool": _load_tool(tool_def["tool"]),
+            "callable": _load_callable(tool_def["callable"]),
+        }
+        for tool_def in tool_defs
+    ]
+
+
+def register_tools(tool_defs: Sequence[ToolCall]) -> None:
+    for tool_def in tool_defs:
+        name = tool_def["tool"]["function"]["name"]
+        if name in avail_tool_defs:
+            log.warning(f"Tool {name} is already registered, skipping duplicate")
+            continue
+        avail_tool_defs[name] = tool_def
 
 
-avail_tool_defs: list[ToolCall] = []
+# Available tools keyed by function name.
+avail_tool_defs: dict[str, ToolCall] = {}
 
 external_tools = appConfig.get("tools")
 if external_tools:
-    avail_tool_defs.extend(load_tools(external_tools))
+    register_tools(load_tools(external_tools))
@@ -1,9 +1,12 @@
 from enum import Enum
-from typing import Awaitable, Callable, TypedDict
+from typing import TYPE_CHECKING, Awaitable, Callable, TypedDict
 
-from mcp.types import Prompt
 from ollama._types import Image, Tool  # noqa
 
+if TYPE_CHECKING:
+    # mcp is heavy to import, only pull it in when MCP servers are set up.
+    from mcp.types import Prompt
+
 
 class Author(Enum):
     USER = "me"
@@ -22,7 +25,7 @@ class ToolCall(TypedDict):
 
 
 class PromptCall(TypedDict):
-    prompt: Prompt
+    prompt: "Prompt"
     callable: Callable | Awaitable
 
 
@@ -7,8 +7,17 @@ import pytest_asyncio
 from PIL import Image
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "offline: test does not need a running Ollama server"
+    )
+
+
 @pytest_asyncio.fixture(autouse=True)
-async def load_test_models():
+async def load_test_models(request):
+    if request.node.get_closest_marker("offline"):
+        yield
+        return
     try:
         ollama.show("llama3.2")
     except ollama.ResponseError:
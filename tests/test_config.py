@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import pytest
+
+from oterm.config import AppConfig
+
+
+def read_config(path) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch) -> tuple[AppConfig, list]:
+    config = AppConfig(path=tmp_path / "config.json")
+    writes = []
+    save = config.save
+
+    def counting_save():
+        writes.append(1)
+        save()
+
+    monkeypatch.setattr(config, "save", counting_save)
+    return config, writes
+
+
+@pytest.mark.offline
+def test_set_without_loop_writes_immediately(config):
+    cfg, writes = config
+    cfg.set("theme", "textual-light")
+    assert len(writes) == 1
+    assert read_config(cfg._path)["theme"] == "textual-light"
+
+
+@pytest.mark.offline
+@pytest.mark.asyncio
+async def test_set_on_loop_coalesces_writes(config):
+    cfg, writes = config
+    for i in range(5):
+        cfg.set("counter", i)
+    assert writes == []
+    assert "counter" not in read_config(cfg._path)
+
+    await asyncio.sleep(0.6)
+    assert len(writes) == 1
+    assert read_config(cfg._path)["counter"] == 4
+
+
+@pytest.mark.offline
+def test_flush_persists_pending_change_after_loop_closes(config):
+    cfg, writes = config
+
+    async def set_value():
+        cfg.set("splash-screen", False)
+
+    asyncio.run(set_value())
+    assert writes == []
+    assert read_config(cfg._path)["splash-screen"] is True
+
+    cfg._flush()
+    assert len(writes) == 1
+    assert read_config(cfg._path)["splash-screen"] is False
+
+    # Nothing pending, nothing written.
+    cfg._flush()
+    assert len(writes) == 1
@@ -1,7 +1,9 @@
 import pytest
-from ollama import ResponseError
+from ollama import ChatResponse, Message, ResponseError
 
+from oterm import ollamaclient
 from oterm.ollamaclient import OllamaLLM
+from oterm.tools.date_time import DateTimeTool
 from oterm.tools.location import LocationTool
 
 
@@ -42,7 +44,7 @@ async def test_iterator():
     llm = OllamaLLM()
     response = ""
     async for text in llm.stream("Please add 2 and 2"):
-        response = text
+        response += text
     assert "4" in response
 
 
@@ -63,5 +65,49 @@ async def test_tool_streaming():
     async for text in llm.stream(
         "In which city am I currently located?. Reply with no other text, just the city."
     ):
-        response = text
+        response += text
     assert "New York" in response
+
+
+@pytest.mark.offline
+@pytest.mark.asyncio
+async def test_completion_tool_rounds(monkeypatch):
+    tool_call = Message.ToolCall(
+        function=Message.ToolCall.Function(name="date_time", arguments={})
+    )
+    responses = [
+        Message(role="assistant", tool_calls=[tool_call]),
+        Message(role="assistant", tool_calls=[tool_call]),
+        Message(role="assistant", content="It is now."),
+    ]
+    sent = []
+
+    class FakeClient:
+        async def chat(self, messages, **kwargs):
+            sent.append(list(messages))
+            return ChatResponse(message=responses[len(sent) - 1])
+
+    monkeypatch.setattr(ollamaclient, "_get_async_client", lambda: FakeClient())
+    llm = OllamaLLM(
+        system="You are a clock.",
+        tool_defs=[{"tool": DateTimeTool, "callable": lambda: "now"}],
+    )
+    res = await llm.completion("What time is it?")
+    assert res == "It is now."
+
+    # Every round resends the history plus the tool calls and replies so far.
+    assert [len(messages) for messages in sent] == [2, 4, 6]
+    assert sent[2][2:] == [
+        responses[0],
+        {"role": "tool", "content": "now", "name": "date_time"},
+        responses[1],
+        {"role": "tool", "content": "now", "name": "date_time"},
+    ]
+
+    # Tool messages stay out of the history.
+    assert [message.role for message in llm.history] == [
+        "system",
+        "user",
+        "assistant",
+    ]
+    assert llm.history[-1] is responses[2]
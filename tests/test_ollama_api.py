@@ -48,3 +48,34 @@ def test_pull():
         entries = [entry for entry in stream]
         assert excinfo.value == "pull model manifest: file does not exist"
         assert "success" not in entries
+
+
+@pytest.mark.offline
+def test_parse_ollama_parameters():
+    # Padded the way `ollama show` prints parameters.
+    params = parse_ollama_parameters(
+        "num_ctx                        4096\n"
+        "temperature                    0.7\n"
+        "penalize_newline               false\n"
+        'stop                           "<|start_header_id|>"\n'
+        'stop                           "<|eot_id|>"\n'
+        "mirostat                       0\n"
+        "mirostat                       2\n"
+        "top_k\t40\n"
+        "seed                           None\n"
+        "unknown_param                  1\n"
+        "\n"
+    )
+    assert params.num_ctx == 4096
+    assert params.temperature == 0.7
+    assert params.penalize_newline is False
+    assert params.stop == ["<|start_header_id|>", "<|eot_id|>"]
+    assert params.mirostat == 2
+    assert params.top_k == 40
+    assert params.seed is None
+    assert "unknown_param" not in params.model_dump()
+
+    # A single stop word stays a plain string.
+    assert parse_ollama_parameters('stop "</s>"').stop == "</s>"
+    # Non-finite numbers are not turned into floats.
+    assert parse_ollama_parameters("temperature inf").temperature == "inf"